@@ -0,0 +1,47 @@
+"""
+Test package for the Account Service
+
+The service creates its tables when it is first imported, so the test
+database must be chosen before any test module imports it. Defaults to an
+in-memory SQLite database; set DATABASE_URI to run against PostgreSQL.
+
+Under pytest-xdist every worker against PostgreSQL gets its own
+<database>_<worker> database, so neither the import-time table creation
+nor the tests themselves share a database between workers.
+"""
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+BASE_DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///:memory:")
+WORKER_DATABASE = None
+
+
+def recreate_database(uri, name, drop_only=False):
+    """Drops and (re)creates a PostgreSQL database on the server in uri"""
+    engine = create_engine(uri, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        # every init_db() call leaves an engine behind, and their pooled
+        # connections would otherwise block DROP DATABASE
+        conn.execute(
+            text(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE datname = :name AND pid <> pg_backend_pid()"
+            ),
+            {"name": name},
+        )
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+        if not drop_only:
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+    engine.dispose()
+
+
+DATABASE_URI = BASE_DATABASE_URI
+_url = make_url(BASE_DATABASE_URI)
+if os.getenv("PYTEST_XDIST_WORKER") and _url.get_backend_name() == "postgresql":
+    # in-memory SQLite is already private to the worker process
+    WORKER_DATABASE = f"{_url.database}_{os.environ['PYTEST_XDIST_WORKER']}"
+    recreate_database(BASE_DATABASE_URI, WORKER_DATABASE)
+    DATABASE_URI = _url.set(database=WORKER_DATABASE).render_as_string(hide_password=False)
+
+os.environ["DATABASE_URI"] = DATABASE_URI
@@ -0,0 +1,86 @@
+"""
+Shared pytest fixtures for the Account Service test suite
+"""
+import logging
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from service.models import db, init_db
+from service.routes import app as service_app
+from tests import BASE_DATABASE_URI, DATABASE_URI, WORKER_DATABASE, recreate_database
+
+
+######################################################################
+#  H O O K S
+######################################################################
+def pytest_sessionfinish(session, exitstatus):  # pylint: disable=unused-argument
+    """Drops this xdist worker's PostgreSQL database when the run ends"""
+    if WORKER_DATABASE:
+        db.session.remove()
+        db.engine.dispose()
+        recreate_database(BASE_DATABASE_URI, WORKER_DATABASE, drop_only=True)
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+@pytest.fixture(scope="session")
+def app():
+    """Configures the Flask app and creates the schema once per session"""
+    service_app.config["TESTING"] = True
+    service_app.config["DEBUG"] = False
+    service_app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+    # TESTING turns on query recording, which hooks every statement
+    service_app.config["SQLALCHEMY_RECORD_QUERIES"] = False
+    service_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    service_app.config["SQLALCHEMY_ECHO"] = False
+    if DATABASE_URI.startswith("sqlite"):
+        # keep one shared connection so the in-memory database survives
+        service_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "connect_args": {"check_same_thread": False},
+            "poolclass": StaticPool,
+        }
+    service_app.logger.setLevel(logging.CRITICAL)
+    init_db(service_app)
+    db.create_all()
+    if db.engine.dialect.name == "sqlite":
+        # pysqlite defers BEGIN on its own, which breaks SAVEPOINT rollback
+        event.listen(db.engine, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+    yield service_app
+    db.session.remove()
+    db.drop_all()
+
+
+@pytest.fixture(scope="session")
+def client(app):  # pylint: disable=redefined-outer-name
+    """A test client shared by every test"""
+    return app.test_client()
+
+
+@pytest.fixture
+def db_session(app):  # pylint: disable=redefined-outer-name, unused-argument
+    """Runs a test inside a transaction that is rolled back afterwards"""
+    connection = db.engine.connect()
+    if connection.dialect.name == "sqlite":
+        connection.connection.dbapi_connection.isolation_level = None
+    trans = connection.begin()
+    session = db.session
+    db.session = db.create_scoped_session(
+        options={"bind": connection, "binds": {}}
+    )
+    nested = connection.begin_nested()
+
+    @event.listens_for(db.session(), "after_transaction_end")
+    def restart_savepoint(sess, transaction):  # pylint: disable=unused-argument
+        """Reopens the SAVEPOINT after the code under test commits"""
+        nonlocal nested
+        if not nested.is_active:
+            nested = connection.begin_nested()
+
+    yield db.session
+
+    # rolling back discards everything the test did, so the per-test
+    # session is simply dropped rather than removed from the registry
+    trans.rollback()
+    connection.close()
+    db.session = session